@@ -2,11 +2,11 @@
 
 import logging
 import sys
-
-from telegram.ext import PicklePersistence
+from pathlib import Path
 
 from .bot import build_app
 from .config import PERSISTENCE_PATH, TELEGRAM_BOT_TOKEN
+from .persistence import SQLitePersistence
 
 logging.basicConfig(
     format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
@@ -16,6 +16,15 @@ logging.basicConfig(
 if not TELEGRAM_BOT_TOKEN:
     sys.exit("TELEGRAM_BOT_TOKEN is not set. Create a .env file or export it.")
 
-persistence = PicklePersistence(filepath=PERSISTENCE_PATH)
+# Earlier versions used PicklePersistence, and older .env files may still
+# point PERSISTENCE_PATH at that pickle: keep the database next to it and
+# import the pickle on first start.
+db_path = Path(PERSISTENCE_PATH)
+if db_path.suffix == ".pickle":
+    db_path = db_path.with_suffix(".sqlite3")
+persistence = SQLitePersistence(
+    filepath=db_path,
+    import_path=db_path.with_suffix(".pickle"),
+)
 app = build_app(TELEGRAM_BOT_TOKEN, persistence=persistence)
 app.run_polling()
@@ -6,11 +6,14 @@ import asyncio
 import datetime
 import io
 import logging
+import math
 import os
 import time
 import zipfile
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
+from datasketch import HyperLogLog
 from PIL import Image
 from telegram import (
     InlineKeyboardButton,
@@ -36,37 +39,139 @@ from .watermark import remove_watermark
 
 logger = logging.getLogger(__name__)
 
-# Buffer media-group messages so we can process batches together.
+# Maximum number of updates handled at once, so one slow image does not
+# hold up commands from other chats.
+_CONCURRENT_UPDATES = 32
+
+# Buffer media-group messages so we can process batches together.  Handlers
+# run concurrently, but these are only touched on the event loop and never
+# across an await, so no lock is needed.
 _group_buffers: dict[str, list[Update]] = defaultdict(list)
-_group_locks: dict[str, asyncio.Event] = {}
+_group_timers: dict[str, asyncio.TimerHandle] = {}
+
+# Seconds of silence after the last message of a media group before the
+# batch is flushed.  Shorter means lower latency, but a slow client may get
+# its album split into two batches.
+_GROUP_IDLE_TIMEOUT = 0.35
 
 _IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".gif", ".bmp", ".webp", ".tiff"}
 
+# Pillow and numpy release the GIL while decoding, processing and encoding,
+# so CPU-bound image work runs here instead of on the event loop.
+_executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+
+# Minimum seconds between progress edits of a status message (Telegram
+# flood-limits editMessageText).
+_PROGRESS_INTERVAL = 1.0
+
+# Longest side of the JPEG preview sent alongside the full-res document.
+_PREVIEW_MAX_SIZE = 1280
+
+# Full-res output settings for lossy sources; PNG sources stay lossless.
+_JPEG_SAVE_OPTIONS = {"quality": 95, "subsampling": 0, "optimize": True}
+
+
+# ---------------------------------------------------------------------------
+# Helpers: dates
+# ---------------------------------------------------------------------------
+
+# Today's ISO date, refreshed at most once a minute.
+_today_cache: dict = {"ts": float("-inf"), "iso": ""}
+
+
+def _today() -> str:
+    """Return today's date as an ISO string, cached for up to a minute."""
+    now = time.monotonic()
+    if now - _today_cache["ts"] > 60:
+        _today_cache["iso"] = str(datetime.date.today())
+        _today_cache["ts"] = now
+    return _today_cache["iso"]
+
 
 # ---------------------------------------------------------------------------
 # Helpers: rate limiting
 # ---------------------------------------------------------------------------
 
-def _check_rate_limit(context: ContextTypes.DEFAULT_TYPE, count: int = 1) -> tuple[bool, int]:
-    """Check if user can process *count* more images today."""
-    today = str(datetime.date.today())
-    rate = context.user_data.get("rate", {})
-    if rate.get("date") != today:
-        rate = {"date": today, "count": 0}
-        context.user_data["rate"] = rate
+# Token bucket: holds up to MAX_IMAGES_PER_DAY images and refills at a rate
+# of MAX_IMAGES_PER_DAY per day.  Wall-clock time is used because the bucket
+# is persisted across restarts.
+_RATE_REFILL_PER_SEC = MAX_IMAGES_PER_DAY / 86400
+
+
+def _refill_bucket(context: ContextTypes.DEFAULT_TYPE) -> dict:
+    """Return the user's token bucket, topped up for the time elapsed."""
+    now = time.time()
+    bucket = context.user_data.get("bucket")
+    if bucket is None:
+        # Carry over today's usage from the legacy daily counter.
+        legacy = context.user_data.pop("rate", {})
+        used = legacy.get("count", 0) if legacy.get("date") == _today() else 0
+        tokens = float(max(MAX_IMAGES_PER_DAY - used, 0))
+        bucket = {"tokens": tokens, "last": now, "retry_at": 0.0}
+        context.user_data["bucket"] = bucket
+    else:
+        elapsed = now - bucket["last"]
+        bucket["tokens"] = min(
+            float(MAX_IMAGES_PER_DAY), bucket["tokens"] + elapsed * _RATE_REFILL_PER_SEC
+        )
+        bucket["last"] = now
+    return bucket
+
 
-    remaining = MAX_IMAGES_PER_DAY - rate["count"]
-    return (count <= remaining), remaining
+def _reserve_rate(context: ContextTypes.DEFAULT_TYPE, count: int = 1) -> tuple[bool, int]:
+    """Take *count* tokens from the user's bucket if enough are available.
 
+    Tokens are taken before any await so concurrent updates from the same
+    user cannot all pass the check; unused ones go back via _refund_rate().
+    """
+    bucket = context.user_data.get("bucket")
+    if bucket is not None and time.time() < bucket["retry_at"]:
+        # Still empty since the last denial; skip the refill math.
+        return False, 0
+
+    bucket = _refill_bucket(context)
+    remaining = int(bucket["tokens"])
+    if count <= remaining:
+        bucket["tokens"] -= count
+        return True, remaining - count
+
+    if remaining < 1 and _RATE_REFILL_PER_SEC > 0:
+        bucket["retry_at"] = (
+            bucket["last"] + (1.0 - bucket["tokens"]) / _RATE_REFILL_PER_SEC
+        )
+    return False, remaining
 
-def _increment_rate(context: ContextTypes.DEFAULT_TYPE, count: int = 1) -> None:
-    """Record that *count* images were processed."""
-    today = str(datetime.date.today())
-    rate = context.user_data.get("rate", {})
-    if rate.get("date") != today:
-        rate = {"date": today, "count": 0}
-    rate["count"] += count
-    context.user_data["rate"] = rate
+
+def _refund_rate(context: ContextTypes.DEFAULT_TYPE, count: int = 1) -> None:
+    """Return *count* reserved tokens for images that were not processed."""
+    if count <= 0:
+        return
+    bucket = _refill_bucket(context)
+    bucket["tokens"] = min(float(MAX_IMAGES_PER_DAY), bucket["tokens"] + count)
+    bucket["retry_at"] = 0.0
+
+
+def _refill_minutes() -> int:
+    """Minutes it takes the bucket to regain one image."""
+    if _RATE_REFILL_PER_SEC <= 0:
+        return 0
+    return math.ceil(1 / _RATE_REFILL_PER_SEC / 60)
+
+
+def _rate_limit_text(context: ContextTypes.DEFAULT_TYPE, lc: str | None, count: int = 1) -> str:
+    """Denial message with the user's allowance and when *count* images fit."""
+    bucket = _refill_bucket(context)
+    needed = min(count, MAX_IMAGES_PER_DAY) - bucket["tokens"]
+    wait = 0
+    if needed > 0 and _RATE_REFILL_PER_SEC > 0:
+        wait = math.ceil(needed / _RATE_REFILL_PER_SEC / 60)
+    return t(
+        "rate_limit_reached", lc,
+        remaining=int(bucket["tokens"]),
+        limit=MAX_IMAGES_PER_DAY,
+        refill=_refill_minutes(),
+        wait=wait,
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -100,62 +205,132 @@ def _format_timestamp(ts: int) -> str:
 
 _STATS_DAYS_KEPT = 30
 
+# Rendered /stats charts, reused for _STATS_CACHE_TTL seconds or until the
+# next _record_usage() call.
+_STATS_CACHE_TTL = 30
+_stats_cache: dict = {"ts": float("-inf"), "overview": None, "users": None}
+
+
+# HyperLogLog precision: 2**12 one-byte registers (~4 KB) per counter, ~1.6%
+# standard error, independent of how many users are counted.
+_HLL_PRECISION = 12
+
+
+def _new_user_counter() -> HyperLogLog:
+    return HyperLogLog(p=_HLL_PRECISION)
+
+
+def _count_users(counter: HyperLogLog) -> int:
+    return round(counter.count())
+
 
 def _init_stats(context: ContextTypes.DEFAULT_TYPE) -> dict:
     """Ensure bot_data['stats'] exists with proper structure."""
     stats = context.bot_data.setdefault("stats", {})
     stats.setdefault("total_images", 0)
-    stats.setdefault("users", set())
     stats.setdefault("user_counts", {})
     stats.setdefault("daily", {})
+
+    # Migrate data persisted before user sets were replaced by HyperLogLog
+    # counters; unique all-time users are the keys of user_counts.
+    if "users" in stats:
+        del stats["users"]
+        for day in stats["daily"].values():
+            counter = _new_user_counter()
+            for uid in day["users"]:
+                counter.update(str(uid).encode())
+            day["users"] = counter
     return stats
 
 
 def _record_usage(context: ContextTypes.DEFAULT_TYPE, user_id: int, count: int = 1) -> None:
     """Record *count* processed images in global stats."""
+    _stats_cache["ts"] = float("-inf")
     stats = _init_stats(context)
     stats["total_images"] += count
-    stats["users"].add(user_id)
     stats["user_counts"][user_id] = stats["user_counts"].get(user_id, 0) + count
 
-    today = str(datetime.date.today())
-    day = stats["daily"].setdefault(today, {"images": 0, "users": set()})
-    day["images"] += count
-    day["users"].add(user_id)
+    today = _today()
+    day = stats["daily"].get(today)
+    if day is None:
+        day = stats["daily"][today] = {"images": 0, "users": _new_user_counter()}
 
-    # Prune entries older than _STATS_DAYS_KEPT.
-    cutoff = str(datetime.date.today() - datetime.timedelta(days=_STATS_DAYS_KEPT))
-    stats["daily"] = {d: v for d, v in stats["daily"].items() if d >= cutoff}
+        # First entry of a new day: prune entries older than _STATS_DAYS_KEPT.
+        cutoff = str(
+            datetime.date.fromisoformat(today)
+            - datetime.timedelta(days=_STATS_DAYS_KEPT)
+        )
+        stats["daily"] = {d: v for d, v in stats["daily"].items() if d >= cutoff}
+    day["images"] += count
+    day["users"].update(str(user_id).encode())
 
 
 # ---------------------------------------------------------------------------
 # Core processing
 # ---------------------------------------------------------------------------
 
-async def _process_and_reply(
-    message,
-    photo_file,
-    context: ContextTypes.DEFAULT_TYPE,
-    filename: str = "cleaned.png",
-) -> dict | None:
-    """Download, remove watermark, send photo preview + full-res document.
+def _save_full_res(image: Image.Image, buf: io.BytesIO, fmt: str) -> None:
+    """Encode a cleaned image as PNG if *fmt* is PNG, else as high-quality JPEG."""
+    if fmt == "PNG":
+        image.save(buf, format="PNG")
+        return
+    try:
+        image.save(buf, format="JPEG", **_JPEG_SAVE_OPTIONS)
+    except OSError:
+        # Pillow's optimize pass buffers ~2 bytes/pixel, which very noisy
+        # images exceed at quality 95 / 4:4:4; encode those unoptimized.
+        buf.seek(0)
+        buf.truncate()
+        image.save(buf, format="JPEG", **{**_JPEG_SAVE_OPTIONS, "optimize": False})
 
-    Returns a history entry dict, or None on failure.
+
+async def _download(tg_file) -> io.BytesIO:
+    """Download a Telegram file into a rewound in-memory buffer."""
+    buf = io.BytesIO()
+    await tg_file.download_to_memory(buf)
+    buf.seek(0)
+    return buf
+
+
+def _clean_image(buf: io.BytesIO) -> tuple[io.BytesIO, io.BytesIO, str]:
+    """Decode, remove watermark, encode photo preview + full-res document.
+
+    The document keeps PNG sources lossless and encodes everything else as
+    high-quality JPEG. Returns ``(photo_buf, doc_buf, filename)``.
     """
-    raw = await photo_file.download_as_bytearray()
-    img = Image.open(io.BytesIO(raw))
+    img = Image.open(buf)
+    img.load()
+    src_fmt = "PNG" if img.format == "PNG" else "JPEG"
+    filename = "cleaned.png" if src_fmt == "PNG" else "cleaned.jpg"
     cleaned = remove_watermark(img)
 
-    # Compressed JPEG preview
+    # Compressed JPEG preview; Telegram downscales photos anyway, so
+    # there is no point encoding and uploading more than it displays.
+    preview = cleaned
+    if max(cleaned.size) > _PREVIEW_MAX_SIZE:
+        preview = cleaned.copy()
+        preview.thumbnail(
+            (_PREVIEW_MAX_SIZE, _PREVIEW_MAX_SIZE), Image.Resampling.BILINEAR
+        )
     photo_buf = io.BytesIO()
-    cleaned.save(photo_buf, format="JPEG", quality=85)
+    preview.save(photo_buf, format="JPEG", quality=85, optimize=True)
     photo_buf.seek(0)
 
-    # Full-res PNG document
+    # Full-res document
     doc_buf = io.BytesIO()
-    cleaned.save(doc_buf, format="PNG")
+    _save_full_res(cleaned, doc_buf, src_fmt)
     doc_buf.seek(0)
 
+    return photo_buf, doc_buf, filename
+
+
+async def _reply_cleaned(
+    message,
+    photo_buf: io.BytesIO,
+    doc_buf: io.BytesIO,
+    filename: str,
+) -> dict:
+    """Send photo preview + full-res document and return a history entry."""
     await message.reply_photo(
         photo=photo_buf,
         reply_to_message_id=message.message_id,
@@ -174,6 +349,40 @@ async def _process_and_reply(
     }
 
 
+async def _process_and_reply(
+    message,
+    photo_file,
+    context: ContextTypes.DEFAULT_TYPE,
+    filename: str | None = None,
+) -> dict | None:
+    """Download, remove watermark, send photo preview + full-res document.
+
+    Returns a history entry dict, or None on failure.
+    """
+    buf = await _download(photo_file)
+    photo_buf, doc_buf, default_name = await asyncio.get_running_loop().run_in_executor(
+        _executor, _clean_image, buf,
+    )
+    return await _reply_cleaned(message, photo_buf, doc_buf, filename or default_name)
+
+
+async def _report_progress(
+    status, lc: str | None, current: int, total: int, last_edit: float,
+) -> float:
+    """Edit *status* with progress, at most once per _PROGRESS_INTERVAL.
+
+    Returns the monotonic time of the most recent edit.
+    """
+    now = time.monotonic()
+    if current >= total or now - last_edit < _PROGRESS_INTERVAL:
+        return last_edit
+    try:
+        await status.edit_text(t("progress", lc, current=current, total=total))
+    except Exception:
+        logger.warning("Failed to update progress", exc_info=True)
+    return now
+
+
 # ---------------------------------------------------------------------------
 # Command handlers
 # ---------------------------------------------------------------------------
@@ -184,7 +393,7 @@ async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
 
 async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     await update.message.reply_text(
-        t("help", lang(update), limit=MAX_IMAGES_PER_DAY),
+        t("help", lang(update), limit=MAX_IMAGES_PER_DAY, refill=_refill_minutes()),
         parse_mode="MarkdownV2",
     )
 
@@ -242,24 +451,29 @@ async def stats_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
     if not ADMIN_ID or update.effective_user.id != ADMIN_ID:
         return
 
-    stats = _init_stats(context)
-    today = str(datetime.date.today())
+    if time.monotonic() - _stats_cache["ts"] >= _STATS_CACHE_TTL:
+        stats = _init_stats(context)
+        today = _today()
 
-    total = stats["total_images"]
-    unique = len(stats["users"])
+        total = stats["total_images"]
+        unique = len(stats["user_counts"])
 
-    today_data = stats["daily"].get(today, {"images": 0, "users": set()})
-    today_imgs = today_data["images"]
-    today_users = len(today_data["users"])
+        today_data = stats["daily"].get(today)
+        today_imgs = today_data["images"] if today_data else 0
+        today_users = _count_users(today_data["users"]) if today_data else 0
 
-    overview_buf = generate_overview_chart(
-        total, unique, today_imgs, today_users, stats["daily"],
-    )
-    await update.message.reply_photo(photo=overview_buf)
+        overview_buf = generate_overview_chart(
+            total, unique, today_imgs, today_users, stats["daily"],
+        )
+        users_buf = generate_top_users_chart(stats.get("user_counts", {}))
 
-    users_buf = generate_top_users_chart(stats.get("user_counts", {}))
-    if users_buf:
-        await update.message.reply_photo(photo=users_buf)
+        _stats_cache["overview"] = overview_buf.getvalue()
+        _stats_cache["users"] = users_buf.getvalue() if users_buf else None
+        _stats_cache["ts"] = time.monotonic()
+
+    await update.message.reply_photo(photo=_stats_cache["overview"])
+    if _stats_cache["users"]:
+        await update.message.reply_photo(photo=_stats_cache["users"])
 
 
 # ---------------------------------------------------------------------------
@@ -271,13 +485,18 @@ async def _handle_single(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     msg = update.message
     lc = lang(update)
 
-    allowed, _remaining = _check_rate_limit(context)
+    allowed, _remaining = _reserve_rate(context)
     if not allowed:
-        await msg.reply_text(t("rate_limit_reached", lc, limit=MAX_IMAGES_PER_DAY))
+        await msg.reply_text(_rate_limit_text(context, lc))
         return
 
-    status = await msg.reply_text(t("processing", lc))
+    try:
+        status = await msg.reply_text(t("processing", lc))
+    except Exception:
+        _refund_rate(context)
+        raise
 
+    processed = False
     try:
         if msg.document:
             if not (msg.document.mime_type or "").startswith("image/"):
@@ -291,58 +510,80 @@ async def _handle_single(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         await status.delete()
 
         if result:
-            _increment_rate(context)
+            processed = True
             _record_usage(context, msg.from_user.id)
             _add_to_history(context, result)
     except Exception:
         logger.exception("Failed to process image")
         await status.edit_text(t("error", lc))
+    finally:
+        if not processed:
+            _refund_rate(context)
 
 
 async def _flush_group(media_group_id: str, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Process a collected batch of media-group messages."""
     updates = _group_buffers.pop(media_group_id, [])
-    _group_locks.pop(media_group_id, None)
+    _group_timers.pop(media_group_id, None)
     if not updates:
         return
 
     first_msg = updates[0].message
     lc = lang(updates[0])
 
-    allowed, _remaining = _check_rate_limit(context, count=len(updates))
+    allowed, _remaining = _reserve_rate(context, count=len(updates))
     if not allowed:
-        await first_msg.reply_text(t("rate_limit_reached", lc, limit=MAX_IMAGES_PER_DAY))
+        await first_msg.reply_text(_rate_limit_text(context, lc, len(updates)))
         return
 
-    status = await first_msg.reply_text(
-        t("processing_batch", lc, count=len(updates))
-    )
+    try:
+        status = await first_msg.reply_text(
+            t("processing_batch", lc, count=len(updates))
+        )
+    except Exception:
+        _refund_rate(context, len(updates))
+        raise
 
-    success = 0
-    for i, upd in enumerate(updates):
-        msg = upd.message
-        try:
-            if len(updates) > 1:
-                await status.edit_text(
-                    t("progress", lc, current=i + 1, total=len(updates))
-                )
+    loop = asyncio.get_running_loop()
 
+    async def _process(i: int, msg) -> tuple[int, tuple | None]:
+        try:
             if msg.document:
                 if not (msg.document.mime_type or "").startswith("image/"):
-                    continue
+                    return i, None
                 photo_file = await msg.document.get_file()
             else:
                 photo_file = await msg.photo[-1].get_file()
 
-            result = await _process_and_reply(msg, photo_file, context)
-            success += 1
-
-            if result:
-                _add_to_history(context, result)
+            buf = await _download(photo_file)
+            return i, await loop.run_in_executor(_executor, _clean_image, buf)
         except Exception:
             logger.exception("Failed to process image in group")
+            return i, None
+
+    # Download and clean all images concurrently, then reply in order.
+    cleaned: list[tuple | None] = [None] * len(updates)
+    done = 0
+    last_edit = time.monotonic()
+    tasks = [_process(i, upd.message) for i, upd in enumerate(updates)]
+    for fut in asyncio.as_completed(tasks):
+        i, item = await fut
+        cleaned[i] = item
+        done += 1
+        last_edit = await _report_progress(status, lc, done, len(updates), last_edit)
+
+    success = 0
+    for upd, item in zip(updates, cleaned):
+        if item is None:
+            continue
+        try:
+            result = await _reply_cleaned(upd.message, *item)
+            success += 1
+            _add_to_history(context, result)
+        except Exception:
+            logger.exception("Failed to send image in group")
 
-    _increment_rate(context, success)
+    _refund_rate(context, len(updates) - success)
     if success:
         _record_usage(context, first_msg.from_user.id, success)
 
@@ -363,31 +604,54 @@ async def handle_image(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
         await _handle_single(update, context)
         return
 
-    # Media group — collect messages and schedule a flush.
+    # Media group — collect messages and flush once no more arrive for
+    # _GROUP_IDLE_TIMEOUT seconds.
     _group_buffers[group_id].append(update)
-    if group_id not in _group_locks:
-        _group_locks[group_id] = asyncio.Event()
-        context.application.job_queue.run_once(
-            lambda ctx: asyncio.ensure_future(_flush_group(group_id, ctx)),
-            when=1.0,
-            name=f"flush_{group_id}",
-        )
+    handle = _group_timers.get(group_id)
+    if handle is not None:
+        handle.cancel()
+
+    # Application.create_task keeps a reference to the task and routes any
+    # exception to the error handlers instead of dropping it.
+    _group_timers[group_id] = asyncio.get_running_loop().call_later(
+        _GROUP_IDLE_TIMEOUT,
+        lambda: context.application.create_task(
+            _flush_group(group_id, context), update=update,
+        ),
+    )
 
 
 # ---------------------------------------------------------------------------
 # ZIP handler
 # ---------------------------------------------------------------------------
 
+def _process_zip_member(zf: zipfile.ZipFile, name: str) -> bytes:
+    """Decode one archive member, remove the watermark and re-encode it.
+
+    The member is streamed straight into Pillow rather than read into a bytes
+    object first; ZipFile serialises reads from worker threads itself.
+    """
+    with zf.open(name) as member:
+        img = Image.open(member)
+        img.load()
+    cleaned = remove_watermark(img)
+
+    cleaned_buf = io.BytesIO()
+    ext = os.path.splitext(name)[1].lower()
+    _save_full_res(cleaned, cleaned_buf, "PNG" if ext == ".png" else "JPEG")
+    return cleaned_buf.getvalue()
+
+
 async def handle_zip(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Accept a ZIP archive, process all images inside, return cleaned ZIP."""
     msg = update.message
     lc = lang(update)
 
     zip_tg_file = await msg.document.get_file()
-    raw = await zip_tg_file.download_as_bytearray()
+    raw = await _download(zip_tg_file)
 
     try:
-        zf = zipfile.ZipFile(io.BytesIO(raw))
+        zf = zipfile.ZipFile(raw)
     except zipfile.BadZipFile:
         await msg.reply_text(t("not_a_zip", lc))
         return
@@ -402,40 +666,53 @@ async def handle_zip(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None
         await msg.reply_text(t("zip_no_images", lc))
         return
 
-    allowed, _remaining = _check_rate_limit(context, count=len(image_names))
+    allowed, _remaining = _reserve_rate(context, count=len(image_names))
     if not allowed:
-        await msg.reply_text(t("rate_limit_reached", lc, limit=MAX_IMAGES_PER_DAY))
+        await msg.reply_text(_rate_limit_text(context, lc, len(image_names)))
         return
 
-    status = await msg.reply_text(
-        t("processing_zip", lc, count=len(image_names))
-    )
+    try:
+        status = await msg.reply_text(
+            t("processing_zip", lc, count=len(image_names))
+        )
+    except Exception:
+        _refund_rate(context, len(image_names))
+        raise
 
     out_buf = io.BytesIO()
     success = 0
 
-    with zipfile.ZipFile(out_buf, "w", zipfile.ZIP_DEFLATED) as out_zip:
-        for i, name in enumerate(image_names):
-            try:
-                await status.edit_text(
-                    t("progress", lc, current=i + 1, total=len(image_names))
-                )
-
-                img = Image.open(io.BytesIO(zf.read(name)))
-                cleaned = remove_watermark(img)
+    loop = asyncio.get_running_loop()
 
-                cleaned_buf = io.BytesIO()
-                ext = os.path.splitext(name)[1].lower()
-                fmt = "PNG" if ext == ".png" else "JPEG"
-                cleaned.save(cleaned_buf, format=fmt)
-
-                out_zip.writestr(name, cleaned_buf.getvalue())
+    async def _process(name: str) -> tuple[str, bytes | None]:
+        try:
+            data = await loop.run_in_executor(
+                _executor, _process_zip_member, zf, name,
+            )
+            return name, data
+        except Exception:
+            logger.exception("Failed to process %s from ZIP", name)
+            return name, None
+
+    done = 0
+    last_edit = time.monotonic()
+
+    # Members are JPEG/PNG, which are already compressed; deflating them again
+    # costs CPU for next to no size gain.
+    with zipfile.ZipFile(out_buf, "w", zipfile.ZIP_STORED) as out_zip:
+        for fut in asyncio.as_completed([_process(name) for name in image_names]):
+            name, data = await fut
+            done += 1
+            if data is not None:
+                out_zip.writestr(name, data)
                 success += 1
-            except Exception:
-                logger.exception("Failed to process %s from ZIP", name)
+
+            last_edit = await _report_progress(
+                status, lc, done, len(image_names), last_edit,
+            )
 
     out_buf.seek(0)
-    _increment_rate(context, success)
+    _refund_rate(context, len(image_names) - success)
     if success:
         _record_usage(context, msg.from_user.id, success)
 
@@ -510,7 +787,7 @@ async def inline_query(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
 
 def build_app(token: str, persistence=None) -> Application:
     """Create and configure the bot application."""
-    builder = Application.builder().token(token)
+    builder = Application.builder().token(token).concurrent_updates(_CONCURRENT_UPDATES)
     if persistence:
         builder = builder.persistence(persistence)
     app = builder.build()
@@ -4,12 +4,13 @@ from __future__ import annotations
 
 import datetime
 import io
+import threading
 
 import matplotlib
 
 matplotlib.use("Agg")
 
-import matplotlib.pyplot as plt  # noqa: E402
+from matplotlib.figure import Figure  # noqa: E402
 
 
 # Shared dark theme colours
@@ -19,6 +20,39 @@ _ACCENT = "#89b4fa"
 _ACCENT2 = "#a6e3a1"
 _GRID = "#45475a"
 
+# Figures are created once and redrawn on every call, which skips figure and
+# canvas setup.  Layout is fixed with subplots_adjust instead of solving
+# tight_layout each time.  The lock serialises callers sharing a figure.
+_lock = threading.Lock()
+_overview: tuple | None = None
+_top_users: tuple | None = None
+
+
+def _overview_figure() -> tuple:
+    global _overview
+    if _overview is None:
+        fig = Figure(figsize=(8, 5), facecolor=_BG)
+        ax_bar, ax_text = fig.subplots(2, 1, gridspec_kw={"height_ratios": [3, 1]})
+        fig.subplots_adjust(left=0.09, right=0.97, top=0.92, bottom=0.03, hspace=0.25)
+        _overview = fig, ax_bar, ax_text
+    return _overview
+
+
+def _top_users_figure() -> tuple:
+    global _top_users
+    if _top_users is None:
+        fig = Figure(figsize=(8, 3), facecolor=_BG)
+        ax = fig.subplots()
+        _top_users = fig, ax
+    return _top_users
+
+
+def _save(fig: Figure) -> io.BytesIO:
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=150, facecolor=_BG)
+    buf.seek(0)
+    return buf
+
 
 def generate_overview_chart(
     total: int,
@@ -34,17 +68,19 @@ def generate_overview_chart(
     for i in range(6, -1, -1):
         d = datetime.date.today() - datetime.timedelta(days=i)
         ds = str(d)
-        day = daily_data.get(ds, {"images": 0, "users": set()})
+        day = daily_data.get(ds)
         dates.append(d.strftime("%b %d"))
-        counts.append(day["images"])
+        counts.append(day["images"] if day else 0)
+
+    with _lock:
+        fig, ax_bar, ax_text = _overview_figure()
+        ax_bar.clear()
+        ax_text.clear()
+        _draw_overview(ax_bar, ax_text, dates, counts, total, unique, today_imgs, today_users)
+        return _save(fig)
 
-    fig, (ax_bar, ax_text) = plt.subplots(
-        2, 1,
-        figsize=(8, 5),
-        gridspec_kw={"height_ratios": [3, 1]},
-        facecolor=_BG,
-    )
 
+def _draw_overview(ax_bar, ax_text, dates, counts, total, unique, today_imgs, today_users) -> None:
     # --- Bar chart ---
     ax_bar.set_facecolor(_BG)
     bars = ax_bar.bar(dates, counts, color=_ACCENT, edgecolor=_ACCENT, width=0.6)
@@ -85,14 +121,6 @@ def generate_overview_chart(
         bbox=dict(boxstyle="round,pad=0.5", facecolor=_GRID, alpha=0.6),
     )
 
-    plt.tight_layout()
-
-    buf = io.BytesIO()
-    fig.savefig(buf, format="png", dpi=150, facecolor=_BG)
-    plt.close(fig)
-    buf.seek(0)
-    return buf
-
 
 def generate_top_users_chart(
     user_counts: dict[int, int],
@@ -111,7 +139,19 @@ def generate_top_users_chart(
     values.reverse()
 
     fig_height = max(3, 0.5 * len(labels) + 1)
-    fig, ax = plt.subplots(figsize=(8, fig_height), facecolor=_BG)
+    with _lock:
+        fig, ax = _top_users_figure()
+        fig.set_size_inches(8, fig_height)
+        # fixed margins in inches, converted to figure fractions
+        fig.subplots_adjust(
+            left=1.4 / 8, right=0.96, top=1 - 0.45 / fig_height, bottom=0.55 / fig_height,
+        )
+        ax.clear()
+        _draw_top_users(ax, labels, values)
+        return _save(fig)
+
+
+def _draw_top_users(ax, labels: list[str], values: list[int]) -> None:
     ax.set_facecolor(_BG)
 
     bars = ax.barh(labels, values, color=_ACCENT2, edgecolor=_ACCENT2, height=0.6)
@@ -124,6 +164,8 @@ def generate_top_users_chart(
     ax.spines["right"].set_visible(False)
     ax.xaxis.grid(True, color=_GRID, linestyle="--", alpha=0.5)
     ax.set_axisbelow(True)
+    # headroom for the value labels, which the fixed layout does not account for
+    ax.set_xlim(0, max(values) * 1.15)
 
     # Value labels on bars
     for bar, val in zip(bars, values):
@@ -134,11 +176,3 @@ def generate_top_users_chart(
             ha="left", va="center",
             color=_FG, fontsize=10, fontweight="bold",
         )
-
-    plt.tight_layout()
-
-    buf = io.BytesIO()
-    fig.savefig(buf, format="png", dpi=150, facecolor=_BG)
-    plt.close(fig)
-    buf.seek(0)
-    return buf
@@ -10,5 +10,5 @@ ASSETS_DIR: Path = Path(__file__).resolve().parent.parent.parent / "assets"
 TELEGRAM_BOT_TOKEN: str = os.environ.get("TELEGRAM_BOT_TOKEN", "")
 MAX_IMAGES_PER_DAY: int = int(os.environ.get("MAX_IMAGES_PER_DAY", "50"))
 HISTORY_SIZE: int = int(os.environ.get("HISTORY_SIZE", "20"))
-PERSISTENCE_PATH: str = os.environ.get("PERSISTENCE_PATH", "bot_data.pickle")
+PERSISTENCE_PATH: str = os.environ.get("PERSISTENCE_PATH", "bot_data.sqlite3")
 ADMIN_ID: int = int(os.environ.get("ADMIN_ID", "0"))
@@ -57,7 +57,8 @@ _STRINGS: dict[str, dict[str, str]] = {
             "/donate \\- Support the developer\n\n"
             "*Inline mode:* Type @gemini\\_watermark\\_best\\_bot in any chat "
             "to share your recently processed images\\.\n\n"
-            "Daily limit: {limit} images per day\\."
+            "Limit: up to {limit} images at once; one more becomes available "
+            "every {refill} minutes\\."
         ),
         "pl": (
             "*Jak używać tego bota:*\n\n"
@@ -72,12 +73,19 @@ _STRINGS: dict[str, dict[str, str]] = {
             "/donate \\- Wesprzyj twórcę\n\n"
             "*Tryb inline:* Wpisz @gemini\\_watermark\\_best\\_bot w dowolnym czacie, "
             "aby udostępnić ostatnio przetworzone obrazy\\.\n\n"
-            "Limit dzienny: {limit} obrazów dziennie\\."
+            "Limit: do {limit} obrazów naraz; kolejny obraz staje się dostępny "
+            "co {refill} minut\\."
         ),
     },
     "rate_limit_reached": {
-        "en": "You've reached your daily limit of {limit} images. Try again tomorrow!",
-        "pl": "Osiągnąłeś dzienny limit {limit} obrazów. Spróbuj ponownie jutro!",
+        "en": (
+            "Not enough images left: {remaining} available now (up to {limit}). "
+            "One more is added every {refill} minutes — try again in {wait} minutes."
+        ),
+        "pl": (
+            "Za mało dostępnych obrazów: teraz {remaining} (maksymalnie {limit}). "
+            "Kolejny dochodzi co {refill} minut — spróbuj ponownie za {wait} minut."
+        ),
     },
     "processing_zip": {
         "en": "Processing ZIP archive ({count} images)…",
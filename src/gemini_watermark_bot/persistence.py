@@ -0,0 +1,211 @@
+"""SQLite persistence backend.
+
+``PicklePersistence`` rewrites the whole pickle every time any user's data
+changes.  ``SQLitePersistence`` keeps state in memory and stores one row per
+``(scope, id, key)``, so an update only writes the top-level keys that
+actually changed.  The database runs in WAL mode and all queries go through a
+single worker thread, keeping disk I/O off the event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import pickle
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from pathlib import Path
+
+from telegram.ext import BasePersistence, PersistenceInput
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS data (
+    scope TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    key TEXT NOT NULL,
+    value BLOB NOT NULL,
+    PRIMARY KEY (scope, id, key)
+)
+"""
+
+# Persistent ids PicklePersistence writes in place of Bot instances.
+_PTB_KNOWN_BOT = "a known bot replaced by PTB's PicklePersistence"
+_PTB_UNKNOWN_BOT = "an unknown bot replaced by PTB's PicklePersistence"
+
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    """Unpickler that understands snapshots written by ``PicklePersistence``."""
+
+    def __init__(self, bot, file) -> None:
+        super().__init__(file)
+        self._bot = bot
+
+    def persistent_load(self, pid: str):
+        if pid == _PTB_KNOWN_BOT:
+            return self._bot
+        if pid == _PTB_UNKNOWN_BOT:
+            return None
+        raise pickle.UnpicklingError(f"Unknown persistent id {pid!r}")
+
+
+class SQLitePersistence(BasePersistence):
+    """In-memory persistence written through to a SQLite database.
+
+    If the database is empty and *import_path* points at a single-file
+    ``PicklePersistence`` snapshot, its contents are imported on first load.
+    """
+
+    def __init__(
+        self,
+        filepath: str | Path,
+        import_path: str | Path | None = None,
+        update_interval: float = 60,
+    ) -> None:
+        super().__init__(
+            store_data=PersistenceInput(callback_data=False),
+            update_interval=update_interval,
+        )
+        self.filepath = Path(filepath)
+        self.import_path = Path(import_path) if import_path else None
+
+        self._conn: sqlite3.Connection | None = None
+        self._data: dict | None = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="persistence")
+
+    async def _run(self, fn, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+
+    # -- loading -------------------------------------------------------------
+
+    def _load_sync(self) -> dict:
+        conn = sqlite3.connect(self.filepath, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(_SCHEMA)
+        self._conn = conn
+
+        data = {"user": {}, "chat": {}, "bot": {}, "conversation": {}}
+        rows = conn.execute("SELECT scope, id, key, value FROM data").fetchall()
+        if not rows and self.import_path and self.import_path.exists():
+            self._import_snapshot(data)
+            return data
+
+        for scope, id_, key, value in rows:
+            data[scope].setdefault(id_, {})[key] = pickle.loads(value)
+        return data
+
+    def _import_snapshot(self, data: dict) -> None:
+        with self.import_path.open("rb") as f:
+            snapshot = _SnapshotUnpickler(getattr(self, "bot", None), f).load()
+
+        data["user"].update(snapshot.get("user_data") or {})
+        data["chat"].update(snapshot.get("chat_data") or {})
+        data["bot"][0] = snapshot.get("bot_data") or {}
+        data["conversation"][0] = snapshot.get("conversations") or {}
+
+        for scope, entries in data.items():
+            for id_, values in entries.items():
+                self._write_sync(scope, id_, values, [])
+        logger.info("Imported persisted data from %s", self.import_path)
+
+    async def _load(self) -> dict:
+        if self._data is None:
+            self._data = await self._run(self._load_sync)
+        return self._data
+
+    # -- writing -------------------------------------------------------------
+
+    def _write_sync(self, scope: str, id_: int, changed: dict, removed: list) -> None:
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO data (scope, id, key, value) VALUES (?, ?, ?, ?)",
+                [
+                    (scope, id_, key, pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+                    for key, value in changed.items()
+                ],
+            )
+            self._conn.executemany(
+                "DELETE FROM data WHERE scope = ? AND id = ? AND key = ?",
+                [(scope, id_, key) for key in removed],
+            )
+
+    def _delete_sync(self, scope: str, id_: int) -> None:
+        with self._conn:
+            self._conn.execute("DELETE FROM data WHERE scope = ? AND id = ?", (scope, id_))
+
+    async def _update(self, scope: str, id_: int, data: dict) -> None:
+        """Store *data* for ``(scope, id_)``, writing only the keys that changed."""
+        entries = (await self._load())[scope]
+        old = entries.get(id_, {})
+        changed = {k: v for k, v in data.items() if k not in old or old[k] != v}
+        removed = [k for k in old if k not in data]
+        if not changed and not removed:
+            return
+        entries[id_] = data
+        await self._run(self._write_sync, scope, id_, changed, removed)
+
+    async def _drop(self, scope: str, id_: int) -> None:
+        if (await self._load())[scope].pop(id_, None) is not None:
+            await self._run(self._delete_sync, scope, id_)
+
+    # -- BasePersistence API -------------------------------------------------
+
+    async def get_user_data(self) -> dict[int, dict]:
+        return deepcopy((await self._load())["user"])
+
+    async def get_chat_data(self) -> dict[int, dict]:
+        return deepcopy((await self._load())["chat"])
+
+    async def get_bot_data(self) -> dict:
+        return deepcopy((await self._load())["bot"].get(0, {}))
+
+    async def get_callback_data(self) -> None:
+        return None
+
+    async def get_conversations(self, name: str) -> dict:
+        conversations = (await self._load())["conversation"].get(0, {})
+        return conversations.get(name, {}).copy()
+
+    async def update_conversation(self, name: str, key: tuple, new_state: object | None) -> None:
+        conversations = (await self._load())["conversation"].setdefault(0, {})
+        handler = conversations.setdefault(name, {})
+        if handler.get(key) == new_state:
+            return
+        handler[key] = new_state
+        await self._run(self._write_sync, "conversation", 0, {name: dict(handler)}, [])
+
+    async def update_user_data(self, user_id: int, data: dict) -> None:
+        await self._update("user", user_id, data)
+
+    async def update_chat_data(self, chat_id: int, data: dict) -> None:
+        await self._update("chat", chat_id, data)
+
+    async def update_bot_data(self, data: dict) -> None:
+        await self._update("bot", 0, data)
+
+    async def update_callback_data(self, data) -> None:
+        pass
+
+    async def drop_user_data(self, user_id: int) -> None:
+        await self._drop("user", user_id)
+
+    async def drop_chat_data(self, chat_id: int) -> None:
+        await self._drop("chat", chat_id)
+
+    async def refresh_user_data(self, user_id: int, user_data: dict) -> None:
+        pass
+
+    async def refresh_chat_data(self, chat_id: int, chat_data: dict) -> None:
+        pass
+
+    async def refresh_bot_data(self, bot_data: dict) -> None:
+        pass
+
+    async def flush(self) -> None:
+        if self._conn is not None:
+            await self._run(self._conn.close)
+            self._conn = None
+        self._executor.shutdown(wait=True)
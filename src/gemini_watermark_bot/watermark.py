@@ -10,6 +10,11 @@ import numpy as np
 from PIL import Image
 from scipy.ndimage import shift as ndshift
 
+try:
+    from numba import njit
+except ImportError:  # optional: fall back to the numpy path
+    njit = None
+
 from .config import ASSETS_DIR
 
 # --- constants ---
@@ -104,23 +109,53 @@ def _near_black_ratio(arr: np.ndarray) -> float:
 
 # --- single-pass reverse blend ---
 
+if njit is not None:
+
+    @njit(nogil=True, fastmath=True, cache=True)
+    def _reverse_blend_kernel(arr, alpha, gain, out):
+        """Single-pass reverse blend of a float (h, w, 3) region into uint8 *out*."""
+        hh, ww = alpha.shape
+        for y in range(hh):
+            for x in range(ww):
+                a = alpha[y, x] * gain
+                if a - ALPHA_NOISE_FLOOR >= ALPHA_THRESHOLD:
+                    a = min(a, MAX_ALPHA)
+                    inv = 1.0 / (1.0 - a)
+                    for c in range(3):
+                        v = (arr[y, x, c] - a * LOGO_VALUE) * inv
+                        if v < 0.0:
+                            out[y, x, c] = 0
+                        elif v > 255.0:
+                            out[y, x, c] = 255
+                        else:
+                            out[y, x, c] = np.uint8(v)
+                else:
+                    for c in range(3):
+                        out[y, x, c] = np.uint8(arr[y, x, c])
+
+
 def _reverse_blend(arr: np.ndarray, alpha: np.ndarray, gain: float = 1.0) -> np.ndarray:
     """Apply reverse alpha blending with given gain."""
-    # denoise: use noise-floor-subtracted alpha for activation mask
-    signal_alpha = np.maximum(alpha * gain - ALPHA_NOISE_FLOOR, 0.0)
-    mask = signal_alpha >= ALPHA_THRESHOLD
+    if njit is not None:
+        out = np.empty(arr.shape, dtype=np.uint8)
+        _reverse_blend_kernel(arr, alpha, float(gain), out)
+        return out
 
-    # use raw (gained) alpha for the actual inverse solve
-    raw = np.minimum(alpha * gain, MAX_ALPHA)
-    a3 = raw[:, :, np.newaxis]
-    om3 = (1.0 - raw)[:, :, np.newaxis]
+    gained = alpha * gain
 
-    restored = (arr - a3 * LOGO_VALUE) / om3
-    restored = np.clip(restored, 0, 255).astype(np.uint8)
+    # denoise: use noise-floor-subtracted alpha for activation mask, and only
+    # touch the pixels it selects (transparent background is left as-is)
+    idx = np.flatnonzero(gained - ALPHA_NOISE_FLOOR >= ALPHA_THRESHOLD)
 
-    original = arr.astype(np.uint8)
-    mask3 = np.stack([mask] * 3, axis=2)
-    return np.where(mask3, restored, original)
+    # use raw (gained) alpha for the actual inverse solve
+    raw = np.minimum(gained.ravel()[idx], MAX_ALPHA)[:, np.newaxis]
+    restored = arr.reshape(-1, 3)[idx] - raw * LOGO_VALUE
+    np.multiply(restored, 1.0 / (1.0 - raw), out=restored)
+    np.clip(restored, 0, 255, out=restored)
+
+    out = arr.astype(np.uint8)
+    out.reshape(-1, 3)[idx] = restored
+    return out
 
 
 # --- gain search ---
@@ -185,7 +220,9 @@ def _find_best_position(
 
 def remove_watermark(image: Image.Image) -> Image.Image:
     """Remove the Gemini watermark and return the cleaned image."""
-    image = image.convert("RGB")
+    # convert() always copies; decoded JPEGs are already RGB, so skip it then
+    if image.mode != "RGB":
+        image = image.convert("RGB")
     w, h = image.size
 
     config = detect_watermark_config(w, h)
@@ -243,8 +280,11 @@ def remove_watermark(image: Image.Image) -> Image.Image:
             if residual < 0.15:
                 break
 
-    # 5. patch result back
-    patched = Image.fromarray(current.astype(np.uint8), "RGB")
-    out = image.copy()
-    out.paste(patched, (x, y))
-    return out
+    # 5. patch result back into a single full-frame copy
+    # (clipped to the frame, as paste() would, for images smaller than the logo)
+    full = np.array(image)
+    x0, y0 = max(x, 0), max(y, 0)
+    x1, y1 = min(x + ww, w), min(y + hh, h)
+    if x0 < x1 and y0 < y1:
+        full[y0:y1, x0:x1] = current[y0 - y:y1 - y, x0 - x:x1 - x]
+    return Image.fromarray(full, "RGB")